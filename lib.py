@@ -1,16 +1,19 @@
 import sqlite3
 import os
-import locale
-from typing import List, Dict, Tuple, Optional, Any
+import contextlib
+import copy
+import functools
+import inspect
+import threading
+from typing import List, Dict, Tuple, Optional, Any, Callable, Iterator
 
-# Set locale for number formatting (German format)
-try:
-    locale.setlocale(locale.LC_ALL, 'de_DE')
-except:
-    try:
-        locale.setlocale(locale.LC_ALL, 'German')
-    except:
-        pass  # If locale setting fails, we'll use a custom formatting function
+import numpy as np
+import pandas as pd
+
+# Swaps the English separators for German ones (thousands '.', decimal ',') in one pass.
+# str.translate maps every character independently, so no placeholder character is needed
+# as with a chain of str.replace calls.
+_DE_TRANS = str.maketrans({',': '.', '.': ','})
 
 def format_number(number: float, decimal_places: int = 2) -> str:
     """
@@ -21,49 +24,222 @@ def format_number(number: float, decimal_places: int = 2) -> str:
         decimal_places (int): Number of decimal places to show
 
     Returns:
-        str: Formatted number string with thousand separators
+        str: Formatted number string with German thousand and decimal separators
     """
-    try:
-        return locale.format_string(f'%.{decimal_places}f', number, grouping=True)
-    except:
-        # Fallback if locale formatting fails
-        return f"{number:,.{decimal_places}f}".replace(",", "X").replace(".", ",").replace("X", ".")
+    return f"{number:,.{decimal_places}f}".translate(_DE_TRANS)
 
-def init_db() -> None:
+def format_number_series(series: pd.Series, decimal_places: int = 2) -> pd.Series:
     """
-    Initialize the SQLite database with the required table structure.
+    Format a whole Series of numbers like format_number.
+
+    Args:
+        series (pd.Series): Numeric values to format
+        decimal_places (int): Number of decimal places to show
+
+    Returns:
+        pd.Series: Formatted number strings with German thousand and decimal separators
+    """
+    return series.map(f"{{:,.{decimal_places}f}}".format).str.translate(_DE_TRANS)
+
+# Statements are kept as constants so the identical text hits SQLite's statement cache
+_SQL_INSERT = '''
+INSERT INTO scenarios 
+(name, description, worker_amount, individual_costs, overhead_costs, hours, 
+ earning_percentage, vat_percentage, selbstkostensatz, netto, brutto, netto_selbstkosten_diff, geld_fuer_chefchen)
+VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
+'''
+# RETURNING is available since SQLite 3.35
+_HAS_RETURNING = sqlite3.sqlite_version_info >= (3, 35)
+_SQL_INSERT_RETURNING = _SQL_INSERT.rstrip() + ' RETURNING id'
+_SQL_SELECT_ALL = 'SELECT * FROM scenarios ORDER BY created_at DESC'
+_SQL_SELECT_SUMMARY = 'SELECT id, name FROM scenarios ORDER BY created_at DESC'
+_SQL_SELECT_VERSION = 'SELECT COUNT(*), MAX(id) FROM scenarios'
+_SQL_SELECT_MAX_ID = 'SELECT MAX(id) FROM scenarios'
+_SQL_SELECT_ONE = 'SELECT * FROM scenarios WHERE id = ?'
+_SQL_DELETE = 'DELETE FROM scenarios WHERE id = ?'
+
+def _connect() -> sqlite3.Connection:
+    """
+    Open a connection to the scenario database with tuned PRAGMAs.
+
+    WAL mode lets other processes using the database file read while this one writes,
+    busy_timeout makes them wait for each other's write lock instead of failing, and
+    synchronous=NORMAL is safe in WAL mode while saving an fsync per commit.
+
+    Returns:
+        sqlite3.Connection: Connection in autocommit mode
+    """
+    conn = sqlite3.connect('stundenlohn_scenarios.db', isolation_level=None,
+                           check_same_thread=False, cached_statements=256)
+    conn.executescript(
+        "PRAGMA journal_mode=WAL; "
+        "PRAGMA synchronous=NORMAL; "
+        "PRAGMA busy_timeout=30000; "
+        "PRAGMA temp_store=MEMORY; "
+        "PRAGMA cache_size=-8000; "
+        "PRAGMA wal_autocheckpoint=1000;"
+    )
+    return conn
+
+# Serializes the Streamlit session threads on the shared connection
+_DB_LOCK = threading.RLock()
+
+@functools.lru_cache(maxsize=None)
+def get_conn() -> sqlite3.Connection:
+    """
+    Get the shared database connection of this process.
+
+    The connection is opened on first use and reused afterwards, so Streamlit
+    reruns do not reopen the database file for every query. All Streamlit sessions
+    share it, so it must only be used while holding _DB_LOCK (see _locked_conn).
+
+    Returns:
+        sqlite3.Connection: Shared connection with sqlite3.Row as row factory
+    """
+    conn = _connect()
+    conn.row_factory = sqlite3.Row
+    return conn
+
+@contextlib.contextmanager
+def _locked_conn() -> Iterator[sqlite3.Connection]:
+    """
+    Hold _DB_LOCK for the enclosed block and provide the shared connection.
+
+    A transaction on the shared connection is visible to every thread using it, so
+    statements of one session must not interleave with another session's transaction.
+
+    Yields:
+        sqlite3.Connection: The shared connection
+    """
+    with _DB_LOCK:
+        yield get_conn()
+
+def _db_errors(message: str, default: Any = None) -> Callable:
+    """
+    Decorator that reports database errors of the wrapped function and returns a default instead.
+
+    Keeps the error reporting of all database functions in one place instead of repeating
+    a try/except block in every function body.
+
+    Args:
+        message (str): Error message prefix, may contain {placeholders} for the function arguments
+        default (Any, optional): Value returned if an error occurred, copied per call. Defaults to None.
+
+    Returns:
+        Callable: The decorator
+    """
+    def decorator(fn: Callable) -> Callable:
+        @functools.wraps(fn)
+        def wrapper(*args, **kwargs):
+            try:
+                return fn(*args, **kwargs)
+            except Exception as e:
+                try:
+                    bound = inspect.signature(fn).bind_partial(*args, **kwargs)
+                    bound.apply_defaults()
+                    text = message.format(**bound.arguments)
+                except Exception:
+                    # Arguments that do not fit the signature or the placeholders
+                    # must not raise inside the error handler
+                    text = message
+                print(f"{text}: {e}")
+                return copy.copy(default)
+        return wrapper
+    return decorator
+
+@contextlib.contextmanager
+def _write_transaction(conn: sqlite3.Connection) -> Iterator[sqlite3.Cursor]:
+    """
+    Run the enclosed statements in one explicit write transaction.
+
+    The connection is in autocommit mode, so ``with conn:`` would not open a transaction.
+    BEGIN IMMEDIATE takes the write lock up front; the transaction is committed on success
+    and rolled back if an exception is raised, including a failing COMMIT.
+    The caller must hold _DB_LOCK for the whole transaction.
+
+    Args:
+        conn (sqlite3.Connection): Connection to run the transaction on
+
+    Yields:
+        sqlite3.Cursor: Cursor to execute the statements with
     """
+    cursor = conn.cursor()
+    cursor.execute('BEGIN IMMEDIATE')
     try:
-        conn = sqlite3.connect('stundenlohn_scenarios.db')
-        cursor = conn.cursor()
-
-        cursor.execute('''
-        CREATE TABLE IF NOT EXISTS scenarios (
-            id INTEGER PRIMARY KEY AUTOINCREMENT,
-            name TEXT NOT NULL,
-            description TEXT,
-            worker_amount INTEGER NOT NULL,
-            individual_costs REAL NOT NULL,
-            overhead_costs REAL NOT NULL,
-            hours REAL NOT NULL,
-            earning_percentage REAL NOT NULL,
-            vat_percentage REAL NOT NULL,
-            selbstkostensatz REAL NOT NULL,
-            netto REAL NOT NULL,
-            brutto REAL NOT NULL,
-            netto_selbstkosten_diff REAL NOT NULL,
-            geld_fuer_chefchen REAL NOT NULL,
-            created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP
-        )
-        ''')
+        yield cursor
+        cursor.execute('COMMIT')
+    except BaseException:
+        if conn.in_transaction:
+            conn.rollback()
+        raise
+
+@_db_errors("Database initialization error", False)
+def init_db() -> bool:
+    """
+    Initialize the SQLite database with the required table structure.
 
-        conn.commit()
-    except Exception as e:
-        print(f"Database initialization error: {e}")
-    finally:
-        if 'conn' in locals():
-            conn.close()
+    Returns:
+        bool: True if the database was initialized, False if an error occurred
+    """
+    with _locked_conn() as conn:
+        # The journal mode is persisted in the database header
+        conn.execute('PRAGMA journal_mode=WAL')
+
+        # Create the schema atomically
+        with _write_transaction(conn) as cursor:
+            cursor.execute('''
+            CREATE TABLE IF NOT EXISTS scenarios (
+                id INTEGER PRIMARY KEY AUTOINCREMENT,
+                name TEXT NOT NULL,
+                description TEXT,
+                worker_amount INTEGER NOT NULL,
+                individual_costs REAL NOT NULL,
+                overhead_costs REAL NOT NULL,
+                hours REAL NOT NULL,
+                earning_percentage REAL NOT NULL,
+                vat_percentage REAL NOT NULL,
+                selbstkostensatz REAL NOT NULL,
+                netto REAL NOT NULL,
+                brutto REAL NOT NULL,
+                netto_selbstkosten_diff REAL NOT NULL,
+                geld_fuer_chefchen REAL NOT NULL,
+                created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP
+            )
+            ''')
+
+            # Lets the listing query walk the index instead of sorting the table
+            cursor.execute('''
+            CREATE INDEX IF NOT EXISTS idx_scenarios_created_desc ON scenarios(created_at DESC)
+            ''')
+
+        # Refresh query planner statistics on startup
+        conn.execute('PRAGMA optimize')
+    return True
+
+@_db_errors("Database optimization error")
+def optimize() -> None:
+    """
+    Let SQLite refresh its query planner statistics where they are outdated.
+    """
+    with _locked_conn() as conn:
+        conn.execute('PRAGMA optimize')
+
+def _insert_params(scenario: Dict[str, Any], rates: Tuple[float, ...]) -> Tuple[Any, ...]:
+    """
+    Build the _SQL_INSERT parameters of one scenario.
+
+    Args:
+        scenario (Dict[str, Any]): All save_scenario arguments by name, including defaults
+        rates (Tuple[float, ...]): Hourly rates of the scenario in the order returned by calc_hourwages
 
+    Returns:
+        Tuple[Any, ...]: Parameters in the column order of _SQL_INSERT
+    """
+    return (scenario['name'], scenario['description'], scenario['worker_amount'],
+            scenario['individual_costs'], scenario['overhead_costs'], scenario['hours'],
+            scenario['earning_percentage'], scenario['vat_percentage'], *rates)
+
+@_db_errors("Error saving scenario", -1)
 def save_scenario(name: str, worker_amount: int, individual_costs: float, 
                  overhead_costs: float, hours: float, earning_percentage: float, 
                  vat_percentage: float, description: str = "", chef: bool = False) -> int:
@@ -83,33 +259,64 @@ def save_scenario(name: str, worker_amount: int, individual_costs: float,
     Returns:
         int: ID of the saved scenario or -1 if an error occurred
     """
-    try:
-        selbstkostensatz, netto, brutto, netto_selbstkosten_diff, chef_kondensat = calc_hourwages(
-            worker_amount, individual_costs, overhead_costs, 
-            hours, earning_percentage, vat_percentage, geld_f_chefchen=chef
-        )
-
-        conn = sqlite3.connect('stundenlohn_scenarios.db')
-        cursor = conn.cursor()
+    # All arguments by name, taken before any other local variable exists
+    scenario = dict(locals())
+    rates = calc_hourwages(
+        worker_amount, individual_costs, overhead_costs,
+        hours, earning_percentage, vat_percentage, geld_f_chefchen=chef
+    )
+    params = _insert_params(scenario, rates)
+
+    with _locked_conn() as conn, _write_transaction(conn) as cursor:
+        if _HAS_RETURNING:
+            scenario_id = cursor.execute(_SQL_INSERT_RETURNING, params).fetchone()[0]
+        else:
+            cursor.execute(_SQL_INSERT, params)
+            scenario_id = cursor.lastrowid
+    return scenario_id
+
+@_db_errors("Error saving scenarios", [])
+def save_scenarios_bulk(rows: List[Tuple[Any, ...]]) -> List[int]:
+    """
+    Save several scenarios to the database in a single transaction.
 
-        cursor.execute('''
-        INSERT INTO scenarios 
-        (name, description, worker_amount, individual_costs, overhead_costs, hours, 
-         earning_percentage, vat_percentage, selbstkostensatz, netto, brutto, netto_selbstkosten_diff, geld_fuer_chefchen)
-        VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
-        ''', (name, description, worker_amount, individual_costs, overhead_costs, hours, 
-              earning_percentage, vat_percentage, selbstkostensatz, netto, brutto, netto_selbstkosten_diff, chef_kondensat))
+    Args:
+        rows (List[Tuple[Any, ...]]): One tuple per scenario with the arguments of save_scenario
+            in positional order (name, worker_amount, ..., vat_percentage[, description[, chef]])
 
-        scenario_id = cursor.lastrowid
-        conn.commit()
-        return scenario_id
-    except Exception as e:
-        print(f"Error saving scenario: {e}")
-        return -1
-    finally:
-        if 'conn' in locals():
-            conn.close()
+    Returns:
+        List[int]: IDs of the saved scenarios in input order, or an empty list if an error occurred
+    """
+    if not rows:
+        return []
 
+    # Complete every row with the defaults of save_scenario and key it by argument name
+    signature = inspect.signature(save_scenario)
+    scenarios = []
+    for row in rows:
+        bound = signature.bind(*row)
+        bound.apply_defaults()
+        scenarios.append(bound.arguments)
+
+    def column(field: str) -> List[Any]:
+        return [scenario[field] for scenario in scenarios]
+
+    # Calculate the hourly rates of all scenarios in one vectorized pass
+    rates = calc_hourwages_vec(
+        column('worker_amount'), column('individual_costs'), column('overhead_costs'),
+        column('hours'), column('earning_percentage'), column('vat_percentage'), column('chef')
+    )
+    rates = zip(*(values.tolist() for values in rates))
+    params = [_insert_params(scenario, scenario_rates) for scenario, scenario_rates in zip(scenarios, rates)]
+
+    with _locked_conn() as conn, _write_transaction(conn) as cursor:
+        cursor.executemany(_SQL_INSERT, params)
+        # _DB_LOCK and the database write lock are held, so no other insert can
+        # interleave and the new IDs are consecutive
+        last_id = cursor.execute(_SQL_SELECT_MAX_ID).fetchone()[0]
+    return list(range(last_id - len(params) + 1, last_id + 1))
+
+@_db_errors("Error retrieving scenarios", [])
 def get_all_scenarios() -> List[Dict[str, Any]]:
     """
     Retrieve all saved scenarios from the database.
@@ -117,23 +324,48 @@ def get_all_scenarios() -> List[Dict[str, Any]]:
     Returns:
         List[Dict[str, Any]]: List of dictionaries containing scenario data
     """
-    try:
-        conn = sqlite3.connect('stundenlohn_scenarios.db')
-        conn.row_factory = sqlite3.Row
-        cursor = conn.cursor()
+    with _locked_conn() as conn:
+        rows = conn.execute(_SQL_SELECT_ALL).fetchall()
 
-        cursor.execute('SELECT * FROM scenarios ORDER BY created_at DESC')
-        rows = cursor.fetchall()
+    scenarios = [dict(row) for row in rows]
+    return scenarios
 
-        scenarios = [dict(row) for row in rows]
-        return scenarios
-    except Exception as e:
-        print(f"Error retrieving scenarios: {e}")
-        return []
-    finally:
-        if 'conn' in locals():
-            conn.close()
+@_db_errors("Error retrieving scenarios", pd.DataFrame())
+def get_all_scenarios_df() -> pd.DataFrame:
+    """
+    Retrieve all saved scenarios from the database as a DataFrame.
+
+    Returns:
+        pd.DataFrame: One row per scenario, newest first; empty if an error occurred
+    """
+    with _locked_conn() as conn:
+        return pd.read_sql_query(_SQL_SELECT_ALL, conn)
+
+@_db_errors("Error retrieving scenario summaries", [])
+def list_scenarios_summary() -> List[Tuple[int, str]]:
+    """
+    Retrieve only the ID and name of all saved scenarios, e.g. for selection widgets.
+
+    Returns:
+        List[Tuple[int, str]]: List of (id, name) tuples, newest first
+    """
+    with _locked_conn() as conn:
+        rows = conn.execute(_SQL_SELECT_SUMMARY).fetchall()
+    return [tuple(row) for row in rows]
+
+@_db_errors("Error retrieving scenarios version", (0, 0))
+def get_scenarios_version() -> Tuple[int, int]:
+    """
+    Get a cheap fingerprint of the scenarios table that changes on every insert or delete.
+
+    Returns:
+        Tuple[int, int]: Number of scenarios and highest scenario ID, (0, 0) if empty or on error
+    """
+    with _locked_conn() as conn:
+        count, max_id = conn.execute(_SQL_SELECT_VERSION).fetchone()
+    return count, max_id or 0
 
+@_db_errors("Error retrieving scenario {scenario_id}", None)
 def get_scenario(scenario_id: int) -> Optional[Dict[str, Any]]:
     """
     Retrieve a specific scenario by ID.
@@ -144,23 +376,13 @@ def get_scenario(scenario_id: int) -> Optional[Dict[str, Any]]:
     Returns:
         Optional[Dict[str, Any]]: Dictionary containing scenario data or None if not found
     """
-    try:
-        conn = sqlite3.connect('stundenlohn_scenarios.db')
-        conn.row_factory = sqlite3.Row
-        cursor = conn.cursor()
-
-        cursor.execute('SELECT * FROM scenarios WHERE id = ?', (scenario_id,))
-        row = cursor.fetchone()
+    with _locked_conn() as conn:
+        row = conn.execute(_SQL_SELECT_ONE, (scenario_id,)).fetchone()
 
-        scenario = dict(row) if row else None
-        return scenario
-    except Exception as e:
-        print(f"Error retrieving scenario {scenario_id}: {e}")
-        return None
-    finally:
-        if 'conn' in locals():
-            conn.close()
+    scenario = dict(row) if row else None
+    return scenario
 
+@_db_errors("Error deleting scenario {scenario_id}", False)
 def delete_scenario(scenario_id: int) -> bool:
     """
     Delete a scenario from the database.
@@ -171,21 +393,75 @@ def delete_scenario(scenario_id: int) -> bool:
     Returns:
         bool: True if deletion was successful, False otherwise
     """
-    try:
-        conn = sqlite3.connect('stundenlohn_scenarios.db')
-        cursor = conn.cursor()
-
-        cursor.execute('DELETE FROM scenarios WHERE id = ?', (scenario_id,))
+    with _locked_conn() as conn, _write_transaction(conn) as cursor:
+        cursor.execute(_SQL_DELETE, (scenario_id,))
         success = cursor.rowcount > 0
+    return success
 
-        conn.commit()
-        return success
-    except Exception as e:
-        print(f"Error deleting scenario {scenario_id}: {e}")
-        return False
-    finally:
-        if 'conn' in locals():
-            conn.close()
+def _hourwages_formula(worker_amount: Any, individual_costs: Any, overhead_costs: Any, hours: Any,
+                       earning_percentage: Any, vat_percentage: Any, geld_f_chefchen: Any) -> Tuple[Any, ...]:
+    """
+    Hourly rate formulas without rounding, shared by calc_hourwages and calc_hourwages_vec.
+
+    Works on plain numbers as well as NumPy arrays. The billable hours (worker_amount * hours)
+    must not be 0; geld_f_chefchen is used as a factor of 1 or 0.
+    """
+    gesamt_einzelkosten = worker_amount * individual_costs
+    selbstkosten = gesamt_einzelkosten + overhead_costs
+    verrechenbare_stunden = worker_amount * hours
+
+    selbstkostensatz = selbstkosten / verrechenbare_stunden
+    netto = selbstkostensatz * (1 + earning_percentage)
+    brutto = netto * (1 + vat_percentage)
+    netto_selbstkosten_diff = netto - selbstkostensatz
+    # Adding 0.0 turns the -0.0 of a zero factor times a negative difference into 0.0
+    chef_kondensat = netto_selbstkosten_diff * (0.6 * earning_percentage) * geld_f_chefchen + 0.0
+    netto_selbstkosten_diff = netto_selbstkosten_diff - chef_kondensat
+    brutto = brutto - chef_kondensat
+
+    return selbstkostensatz, netto, brutto, netto_selbstkosten_diff, chef_kondensat
+
+def _round_cents(values: np.ndarray) -> np.ndarray:
+    """
+    Round an array to 2 decimal places with Python's round(), like calc_hourwages.
+
+    np.round scales by 100 before rounding and can be off by one cent on half-cent values.
+    """
+    return np.array([round(value, 2) for value in values.ravel().tolist()]).reshape(values.shape)
+
+def calc_hourwages_vec(worker_amount: Any, individual_costs: Any, overhead_costs: Any, hours: Any,
+                       earning_percentage: Any, vat_percentage: Any, geld_f_chefchen: Any) -> Tuple[np.ndarray, ...]:
+    """
+    Calculate hourly rates for many parameter combinations at once.
+
+    All arguments accept scalars or array-likes and are broadcast against each other,
+    e.g. to sweep the profit margin over a range of values.
+
+    Args:
+        worker_amount: Number of employees
+        individual_costs: Cost per employee
+        overhead_costs: Overhead costs
+        hours: Billable hours per employee
+        earning_percentage: Profit margin as a decimal (e.g., 0.15 for 15%)
+        vat_percentage: VAT rate as a decimal (e.g., 0.19 for 19%)
+        geld_f_chefchen: Flag(s) to indicate if the calculation includes "Verdampfung"
+
+    Returns:
+        tuple: Arrays (self_cost_rate, net_rate, gross_rate, netto_selbstkosten_diff, chef_kondensat) rounded
+        to 2 decimal places with round() like calc_hourwages; entries with no billable hours are 0.0
+    """
+    worker_amount = np.asarray(worker_amount, dtype=float)
+    hours = np.asarray(hours, dtype=float)
+    valid = (worker_amount > 0) & (hours > 0)
+
+    # Calculate invalid entries with 1 worker and 1 hour and zero them afterwards
+    results = _hourwages_formula(
+        np.where(valid, worker_amount, 1.0), np.asarray(individual_costs, dtype=float),
+        np.asarray(overhead_costs, dtype=float), np.where(valid, hours, 1.0),
+        np.asarray(earning_percentage, dtype=float), np.asarray(vat_percentage, dtype=float),
+        np.asarray(geld_f_chefchen, dtype=bool)
+    )
+    return tuple(_round_cents(np.where(valid, r, 0.0)) for r in results)
 
 def calc_hourwages(worker_amount: int, individual_costs: float, overhead_costs: float, hours: float, earning_percentage: float, vat_percentage : float, geld_f_chefchen: bool) -> Tuple[float, float, float, float, float]:
     """
@@ -213,25 +489,11 @@ def calc_hourwages(worker_amount: int, individual_costs: float, overhead_costs:
         if hours <= 0:
             raise ValueError("Fakturierbare Stunden müssen größer als 0 sein")
 
-        gesamt_einzelkosten = worker_amount * individual_costs
-        selbstkosten = gesamt_einzelkosten + overhead_costs
-        verrechenbare_stunden = worker_amount * hours
-
-        # Prevent division by zero
-        if verrechenbare_stunden == 0:
-            raise ValueError("Verrechenbare Stunden dürfen nicht 0 sein")
-
-        selbstkostensatz = selbstkosten / verrechenbare_stunden
-        netto = selbstkostensatz * (1 + earning_percentage)
-        brutto = netto * (1 + vat_percentage)
-        netto_selbstkosten_diff = netto - selbstkostensatz
-        chef_kondensat = 0.0
-        if geld_f_chefchen:
-            chef_kondensat = netto_selbstkosten_diff * (0.6 * earning_percentage)
-            netto_selbstkosten_diff -= chef_kondensat
-            brutto -= chef_kondensat
-
-        return round(selbstkostensatz, 2), round(netto, 2), round(brutto, 2), round(netto_selbstkosten_diff, 2), round(chef_kondensat, 2)
+        results = _hourwages_formula(
+            worker_amount, individual_costs, overhead_costs,
+            hours, earning_percentage, vat_percentage, bool(geld_f_chefchen)
+        )
+        return tuple(round(r, 2) for r in results)
     except Exception as e:
         print(f"Calculation error: {e}")
         # Return default values in case of error
@@ -1,13 +1,109 @@
-import streamlit as st
+import time
+import numpy as np
 import pandas as pd
+import streamlit as st
 from lib import (
     calc_hourwages, init_db, save_scenario, 
-    get_all_scenarios, delete_scenario,
-    format_number
+    get_all_scenarios_df, list_scenarios_summary, get_scenarios_version, delete_scenario,
+    format_number, format_number_series, optimize
 )
 
-# Initialize the database
-init_db()
+# Interval in seconds between two runs of PRAGMA optimize
+OPTIMIZE_INTERVAL = 900
+
+# Display names of the scenario columns
+COLUMN_LABELS = {
+    'id': 'ID',
+    'name': 'Name',
+    'description': 'Beschreibung',
+    'worker_amount': 'Anzahl MA',
+    'individual_costs': 'Kosten pro MA (€)',
+    'overhead_costs': 'Gemeinkosten (€)',
+    'hours': 'Stunden pro MA',
+    'earning_percentage': 'Gewinn (%)',
+    'vat_percentage': 'MwSt (%)',
+    'selbstkostensatz': 'Selbstkostensatz (€/h)',
+    'netto': 'Netto (€/h)',
+    'brutto': 'Brutto (€/h)',
+    'netto_selbstkosten_diff': 'Netto-Selbstkosten Diff. (€/h)',
+    'geld_fuer_chefchen': 'Geld für Chefchen (€/h)',
+    'created_at': 'Erstellt am'
+}
+
+# Display columns shown with thousand separators and highlighted in the comparison
+NUMERIC_COLS = ['Kosten pro MA (€)', 'Gemeinkosten (€)', 'Selbstkostensatz (€/h)',
+                'Netto (€/h)', 'Brutto (€/h)', 'Netto-Selbstkosten Diff. (€/h)']
+
+@st.cache_resource(show_spinner=False)
+def _init_db_once():
+    """
+    Initialize the database once per process instead of on every rerun.
+
+    Raises if the initialization failed, so Streamlit does not cache the result and retries on the next run.
+    """
+    if not init_db():
+        raise RuntimeError("Die Datenbank konnte nicht initialisiert werden.")
+
+@st.cache_data(max_entries=256)
+def _calc_cached(*args):
+    """
+    Memoized calc_hourwages, so reruns with unchanged inputs skip the calculation.
+    """
+    return calc_hourwages(*args)
+
+@st.cache_data(ttl=30)
+def _summary_cached(version):
+    """
+    Cached (id, name) list of all scenarios, keyed by the table version so reruns without changes skip the query.
+    """
+    return list_scenarios_summary()
+
+@st.cache_data(ttl=30)
+def _display_cached(version):
+    """
+    Scenario table prepared for display, cached by the table version like _summary_cached.
+
+    Returns a pair of DataFrames with the display column names and percentages scaled to 0-100:
+    the first keeps the rounded numeric values, the second has NUMERIC_COLS formatted as strings.
+    """
+    df = get_all_scenarios_df()
+    if df.empty:
+        return df, df
+
+    df = df.rename(columns=COLUMN_LABELS)
+
+    # Format percentages
+    df['Gewinn (%)'] = df['Gewinn (%)'] * 100
+    df['MwSt (%)'] = df['MwSt (%)'] * 100
+
+    # Round numeric columns to 2 decimal places
+    df[NUMERIC_COLS] = df[NUMERIC_COLS].round(2)
+
+    # Format numeric columns with thousand separators
+    display_df = df.copy()
+    for col in NUMERIC_COLS:
+        display_df[col] = format_number_series(df[col], decimal_places=2)
+
+    return df, display_df
+
+def load_display_scenarios():
+    """
+    Load the (numeric, formatted) display tables of all scenarios through the data cache.
+    """
+    return _display_cached(get_scenarios_version())
+
+def load_scenario_options():
+    """
+    Load the (id, name) options for the scenario selection widgets through the data cache.
+    """
+    return _summary_cached(get_scenarios_version())
+
+def invalidate_scenario_caches():
+    """
+    Drop the cached scenario data after the table was modified.
+    """
+    _summary_cached.clear()
+    _display_cached.clear()
 
 # Set page title and configuration
 st.set_page_config(
@@ -16,6 +112,19 @@ st.set_page_config(
     layout="wide"
 )
 
+# Initialize the database (after set_page_config, which must be the first Streamlit command)
+try:
+    _init_db_once()
+except Exception as e:
+    st.error(f"Fehler beim Initialisieren der Datenbank: {str(e)}")
+
+# Periodically refresh the query planner statistics
+if 'last_opt' not in st.session_state:
+    st.session_state['last_opt'] = time.time()
+elif time.time() - st.session_state['last_opt'] > OPTIMIZE_INTERVAL:
+    optimize()
+    st.session_state['last_opt'] = time.time()
+
 # Title and description
 st.title("Stundenlohn Kalkulator")
 st.markdown("""
@@ -86,33 +195,35 @@ with tab1:
 
     # Calculate and display results automatically
     try:
-        selbstkostensatz, netto, brutto, netto_selbst_diff, chef_kondensat = calc_hourwages(
+        selbstkostensatz, netto, brutto, netto_selbst_diff, chef_kondensat = _calc_cached(
             worker_amount, individual_costs, overhead_costs, 
             hours, earning_percentage, vat_percentage, geld_f_chefchen
         )
 
         # Display results in a nice format
         st.markdown("### Ergebnisse")
-        col1, col2, col3, col4, col5 = st.columns(5)
-
-        with col1:
-            st.metric("Selbstkostensatz", f"{format_number(selbstkostensatz)} €/h")
-
-        with col2:
-            st.metric("Netto-Stundensatz", f"{format_number(netto)} €/h")
-
-        with col3:
-            st.metric("Netto-Selbstkosten Diff.", f"{format_number(netto_selbst_diff)} €/h")
-
-        with col4:
-            st.metric("Brutto-Stundensatz", f"{format_number(brutto)} €/h")
-
+        metrics = [
+            ("Selbstkostensatz", selbstkostensatz),
+            ("Netto-Stundensatz", netto),
+            ("Netto-Selbstkosten Diff.", netto_selbst_diff),
+            ("Brutto-Stundensatz", brutto),
+            ("Sonstige", chef_kondensat),
+        ]
+        metrics_html = "".join(
+            f'<div><div class="metric-label">{label}</div>'
+            f'<div class="metric-value">{format_number(value)} €/h</div></div>'
+            for label, value in metrics
+        )
 
-            with col5:
-                if geld_f_chefchen:
-                    st.metric("Sonstige", f"{format_number(chef_kondensat)} €/h")
-                else:
-                    st.metric("Sonstige", "0.00 €/h")
+        # Render all results as one element instead of one st.metric per column
+        st.markdown(f"""
+<style>
+.metrics {{ display: grid; grid-template-columns: repeat(5, 1fr); gap: 1rem; margin-bottom: 1rem; }}
+.metrics .metric-label {{ font-size: 0.875rem; }}
+.metrics .metric-value {{ font-size: 2.25rem; line-height: 1.4; }}
+</style>
+<div class="metrics">{metrics_html}</div>
+""", unsafe_allow_html=True)
 
         # Save scenario option
         with st.expander("Szenario speichern"):
@@ -129,6 +240,7 @@ with tab1:
                             description=scenario_description, chef=geld_f_chefchen
                         )
                         if scenario_id > 0:
+                            invalidate_scenario_caches()
                             st.success(f"Szenario '{scenario_name}' erfolgreich gespeichert!")
                         else:
                             st.error("Fehler beim Speichern des Szenarios.")
@@ -147,43 +259,12 @@ with tab2:
 
     try:
         # Get all scenarios
-        scenarios = get_all_scenarios()
+        _, df = load_display_scenarios()
 
-        if not scenarios:
+        if df.empty:
             st.info("Keine Szenarien gespeichert. Berechnen und speichern Sie ein Szenario im Tab 'Kalkulation'.")
         else:
             try:
-                # Convert to DataFrame for better display
-                df = pd.DataFrame(scenarios)
-
-                # Rename columns for better display
-                df = df.rename(columns={
-                    'id': 'ID',
-                    'name': 'Name',
-                    'description': 'Beschreibung',
-                    'worker_amount': 'Anzahl MA',
-                    'individual_costs': 'Kosten pro MA (€)',
-                    'overhead_costs': 'Gemeinkosten (€)',
-                    'hours': 'Stunden pro MA',
-                    'earning_percentage': 'Gewinn (%)',
-                    'vat_percentage': 'MwSt (%)',
-                    'selbstkostensatz': 'Selbstkostensatz (€/h)',
-                    'netto': 'Netto (€/h)',
-                    'brutto': 'Brutto (€/h)',
-                    'netto_selbstkosten_diff': 'Netto-Selbstkosten Diff. (€/h)',
-                    'geld_fuer_chefchen': 'Geld für Chefchen (€/h)',
-                    'created_at': 'Erstellt am'
-                })
-
-                # Format percentages
-                df['Gewinn (%)'] = df['Gewinn (%)'] * 100
-                df['MwSt (%)'] = df['MwSt (%)'] * 100
-
-                # Format numeric columns with thousand separators
-                for col in ['Kosten pro MA (€)', 'Gemeinkosten (€)', 'Selbstkostensatz (€/h)', 'Netto (€/h)', 'Brutto (€/h)', 'Netto-Selbstkosten Diff. (€/h)']:
-                    if col in df.columns:
-                        df[col] = df[col].apply(lambda x: format_number(x, decimal_places=2))
-
                 # Display the DataFrame
                 st.dataframe(df)
 
@@ -192,7 +273,7 @@ with tab2:
                     with st.form("delete_scenario_form"):
                         scenario_id_to_delete = st.selectbox(
                             "Szenario auswählen", 
-                            options=[(s['id'], s['name']) for s in scenarios],
+                            options=load_scenario_options(),
                             format_func=lambda x: f"{x[0]} - {x[1]}"
                         )
 
@@ -201,6 +282,7 @@ with tab2:
                         if delete_button and scenario_id_to_delete:
                             try:
                                 if delete_scenario(scenario_id_to_delete[0]):
+                                    invalidate_scenario_caches()
                                     st.success(f"Szenario '{scenario_id_to_delete[1]}' erfolgreich gelöscht!")
                                     st.rerun()
                                 else:
@@ -218,109 +300,42 @@ with tab3:
 
     try:
         # Get all scenarios
-        scenarios = get_all_scenarios()
+        numeric_df, display_df = load_display_scenarios()
 
-        if len(scenarios) < 2:
+        if len(numeric_df) < 2:
             st.info("Sie benötigen mindestens zwei gespeicherte Szenarien für einen Vergleich.")
         else:
             # Allow selecting multiple scenarios to compare
             selected_scenario_ids = st.multiselect(
                 "Szenarien zum Vergleich auswählen",
-                options=[(s['id'], s['name']) for s in scenarios],
+                options=load_scenario_options(),
                 format_func=lambda x: f"{x[0]} - {x[1]}"
             )
 
             if selected_scenario_ids:
                 try:
                     # Get the selected scenarios
-                    selected_scenarios = [s for s in scenarios if (s['id'], s['name']) in selected_scenario_ids]
+                    selected_ids = [scenario_id for scenario_id, _ in selected_scenario_ids]
+                    is_selected = numeric_df['ID'].isin(selected_ids)
+                    comparison_df = display_df[is_selected].reset_index(drop=True)
 
-                    if selected_scenarios:
+                    if not comparison_df.empty:
                         try:
-                            # Convert to DataFrame for comparison
-                            comparison_df = pd.DataFrame(selected_scenarios)
-
-                            # Calculate the difference between Netto and Selbstkostensatz
-                            comparison_df['netto_selbstkosten_diff'] = comparison_df['netto'] - comparison_df['selbstkostensatz']
-
-                            # Rename columns for better display
-                            comparison_df = comparison_df.rename(columns={
-                                'id': 'ID',
-                                'name': 'Name',
-                                'description': 'Beschreibung',
-                                'worker_amount': 'Anzahl MA',
-                                'individual_costs': 'Kosten pro MA (€)',
-                                'overhead_costs': 'Gemeinkosten (€)',
-                                'hours': 'Stunden pro MA',
-                                'earning_percentage': 'Gewinn (%)',
-                                'vat_percentage': 'MwSt (%)',
-                                'selbstkostensatz': 'Selbstkostensatz (€/h)',
-                                'netto': 'Netto (€/h)',
-                                'brutto': 'Brutto (€/h)',
-                                'netto_selbstkosten_diff': 'Netto-Selbstkosten Diff. (€/h)',
-                                'created_at': 'Erstellt am'
-                            })
-
-                            # Format percentages
-                            comparison_df['Gewinn (%)'] = comparison_df['Gewinn (%)'] * 100
-                            comparison_df['MwSt (%)'] = comparison_df['MwSt (%)'] * 100
-
-                            # Create a copy of numeric columns for styling before formatting
-                            numeric_cols = ['Kosten pro MA (€)', 'Gemeinkosten (€)', 'Selbstkostensatz (€/h)', 
-                                           'Netto (€/h)', 'Brutto (€/h)', 'Netto-Selbstkosten Diff. (€/h)']
-
-                            # Round numeric columns to 2 decimal places in the styling dataframe
-                            for col in numeric_cols:
-                                if col in comparison_df.columns:
-                                    comparison_df[col] = comparison_df[col].round(2)
-
-                            # Create a copy for styling after rounding
-                            styling_df = comparison_df.copy()
-
-                            # Convert all numeric values in styling_df to strings to avoid styling errors
-                            for col in numeric_cols:
-                                if col in styling_df.columns:
-                                    styling_df[col] = styling_df[col].astype(str)
-
-                            # Format numeric columns with thousand separators
-                            for col in numeric_cols:
-                                if col in comparison_df.columns:
-                                    comparison_df[col] = comparison_df[col].apply(lambda x: format_number(x, decimal_places=2))
+                            # Numeric values of the selected scenarios for highlighting
+                            numeric_values = numeric_df.loc[is_selected, NUMERIC_COLS].to_numpy(dtype=float)
 
                             # Create a styled dataframe to highlight min/max values
-                            if len(selected_scenarios) >= 2:
-                                # Function to highlight the maximum value in a Series
-                                def highlight_max(s):
-                                    # Convert back to float for comparison if the series contains strings
-                                    if s.dtype == 'object':
-                                        try:
-                                            numeric_s = s.astype(float)
-                                            is_max = numeric_s == numeric_s.max()
-                                        except:
-                                            is_max = [False] * len(s)
-                                    else:
-                                        is_max = s == s.max()
-                                    return ['background-color: #90EE90' if v else '' for v in is_max]
-
-                                # Function to highlight the minimum value in a Series
-                                def highlight_min(s):
-                                    # Convert back to float for comparison if the series contains strings
-                                    if s.dtype == 'object':
-                                        try:
-                                            numeric_s = s.astype(float)
-                                            is_min = numeric_s == numeric_s.min()
-                                        except:
-                                            is_min = [False] * len(s)
-                                    else:
-                                        is_min = s == s.min()
-                                    return ['background-color: #CC0000' if v else '' for v in is_min]
+                            if len(comparison_df) >= 2:
+                                # Highlight the maximum and minimum of every column that is not constant
+                                col_max = numeric_values.max(axis=0)
+                                col_min = numeric_values.min(axis=0)
+                                css = np.where(numeric_values == col_max, 'background-color: #90EE90', '')
+                                css = np.where(numeric_values == col_min, 'background-color: #CC0000', css)
+                                css[:, col_max == col_min] = ''
+                                css_df = pd.DataFrame(css, index=comparison_df.index, columns=NUMERIC_COLS)
 
                                 # Apply styling to numeric columns only
-                                styled_df = styling_df.style
-                                for col in numeric_cols:
-                                    if col in styling_df.columns and len(styling_df[col].unique()) > 1:
-                                        styled_df = styled_df.apply(highlight_max, subset=[col])
-                                        styled_df = styled_df.apply(highlight_min, subset=[col])
+                                styled_df = comparison_df.style.apply(lambda _: css_df, axis=None, subset=NUMERIC_COLS)
 
                                 # Display the styled comparison dataframe
                                 st.write("Vergleich der Szenarien (Höchstwerte in Grün, Tiefstwerte in Rot):")